@@ -155,6 +155,7 @@ def save_cookie(var_name: str, cookie: str):
 
 # ---------------- 登录逻辑 ----------------
 def session_login(user, password, solver_type, api_base_url, client_key):
+    solver = None
     try:
         if solver_type.lower() == "yescaptcha":
             print("正在使用 YesCaptcha 解决验证码...")
@@ -186,6 +187,10 @@ def session_login(user, password, solver_type, api_base_url, client_key):
     except Exception as e:
         print(f"验证码错误: {e}")
         return None
+    finally:
+        # 2Captcha / YesCaptcha 解决器持有会话，用完即关闭
+        if isinstance(solver, (TwoCaptchaSolver, YesCaptchaSolver)):
+            solver.close()
 
     session = requests.Session(impersonate="chrome110")
     session.get("https://www.nodeseek.com/signIn.html")
@@ -270,38 +275,39 @@ def get_signin_stats(ns_cookie, days=30):
         now_shanghai = now_utc + utc_offset
         current_month_start = datetime(now_shanghai.year, now_shanghai.month, 1)
         
-        # 获取多页数据以确保覆盖本月所有数据
+        # 获取多页数据以确保覆盖本月所有数据，翻页复用同一会话
         all_records = []
         page = 1
         
-        while page <= 10:  # 最多查询10页，防止无限循环
-            url = f"https://www.nodeseek.com/api/account/credit/page-{page}"
-            response = requests.get(url, headers=headers, impersonate="chrome110")
-            data = response.json()
+        with requests.Session(impersonate="chrome110") as session:
+            while page <= 10:  # 最多查询10页，防止无限循环
+                url = f"https://www.nodeseek.com/api/account/credit/page-{page}"
+                response = session.get(url, headers=headers)
+                data = response.json()
             
-            if not data.get("success") or not data.get("data"):
-                break
+                if not data.get("success") or not data.get("data"):
+                    break
                 
-            records = data.get("data", [])
-            if not records:
-                break
+                records = data.get("data", [])
+                if not records:
+                    break
                 
-            # 检查最后一条记录的时间，如果超出本月范围就停止
-            last_record_time = datetime.fromisoformat(records[-1][3].replace('Z', '+00:00'))
-            last_record_time_shanghai = last_record_time.replace(tzinfo=None) + utc_offset
-            if last_record_time_shanghai < current_month_start:
-                # 只添加在本月范围内的记录
-                for record in records:
-                    record_time = datetime.fromisoformat(record[3].replace('Z', '+00:00'))
-                    record_time_shanghai = record_time.replace(tzinfo=None) + utc_offset
-                    if record_time_shanghai >= current_month_start:
-                        all_records.append(record)
-                break
-            else:
-                all_records.extend(records)
+                # 检查最后一条记录的时间，如果超出本月范围就停止
+                last_record_time = datetime.fromisoformat(records[-1][3].replace('Z', '+00:00'))
+                last_record_time_shanghai = last_record_time.replace(tzinfo=None) + utc_offset
+                if last_record_time_shanghai < current_month_start:
+                    # 只添加在本月范围内的记录
+                    for record in records:
+                        record_time = datetime.fromisoformat(record[3].replace('Z', '+00:00'))
+                        record_time_shanghai = record_time.replace(tzinfo=None) + utc_offset
+                        if record_time_shanghai >= current_month_start:
+                            all_records.append(record)
+                    break
+                else:
+                    all_records.extend(records)
                 
-            page += 1
-            time.sleep(0.5)
+                page += 1
+                time.sleep(0.5)
         
         # 筛选本月签到收益记录
         signin_records = []
@@ -1,208 +1,694 @@
-from curl_cffi import requests
-import time
-import os
-from typing import Dict, Optional, Any, Union
-
-class TwoCaptchaSolverError(Exception):
-    """2Captcha 解决器错误基类"""
-    pass
-
-class TwoCaptchaSolver:
-    """
-    2Captcha 验证码解决工具
-    
-    使用 2Captcha API 解决 Turnstile 验证码，获取验证令牌
-    参考文档: https://2captcha.com/2captcha-api
-    """
-    
-    def __init__(
-        self, 
-        api_key: str,
-        api_base_url: str = "https://api.2captcha.com",
-        max_retries: int = 20,
-        retry_interval: int = 5,
-        timeout: int = 60
-    ):
-        """
-        初始化 2Captcha 验证码解决器
-        
-        参数:
-            api_key: 2Captcha API 密钥
-            api_base_url: API 基础 URL，默认为 2Captcha 官方节点
-            max_retries: 最大重试次数
-            retry_interval: 重试间隔(秒)
-            timeout: 请求超时时间(秒)
-        """
-        self.api_key = api_key
-        self.api_base_url = api_base_url
-        self.create_task_url = f"{api_base_url}/createTask"
-        self.get_result_url = f"{api_base_url}/getTaskResult"
-        self.max_retries = max_retries
-        self.retry_interval = retry_interval
-        self.timeout = timeout
-    
-    def solve(
-        self,
-        url: str,
-        sitekey: str,
-        user_agent: Optional[str] = None,
-        verbose: bool = False
-    ) -> str:
-        """
-        解决 Turnstile 验证并返回令牌
-        
-        参数:
-            url: 目标网站 URL
-            sitekey: Turnstile sitekey
-            user_agent: 自定义 User-Agent
-            verbose: 是否打印详细日志
-            
-        返回:
-            验证令牌字符串
-            
-        异常:
-            TwoCaptchaSolverError: 解决验证码时出错
-        """
-        if verbose:
-            print("正在创建 2Captcha 验证任务...")
-            
-        task_id = self._create_task(url, sitekey, user_agent, verbose)
-        if not task_id:
-            raise TwoCaptchaSolverError("创建验证码任务失败")
-            
-        # 获取任务结果
-        token = self._get_task_result(task_id, verbose)
-        if not token:
-            raise TwoCaptchaSolverError("获取验证码结果失败")
-            
-        if verbose:
-            print(f"验证码解决成功: {token[:30]}...{token[-10:] if len(token) > 30 else ''}")
-            
-        return token
-        
-    def _create_task(
-        self,
-        url: str,
-        sitekey: str,
-        user_agent: Optional[str] = None,
-        verbose: bool = False
-    ) -> Optional[str]:
-        """创建验证码任务并返回任务ID"""
-        
-        # 准备任务数据 - 使用JSON格式，与YesCaptcha类似
-        data = {
-            "clientKey": self.api_key,
-            "task": {
-                "type": "TurnstileTaskProxyless",
-                "websiteURL": url,
-                "websiteKey": sitekey
-            }
-        }
-        
-        # 如果需要添加用户代理
-        if user_agent:
-            data["task"]["userAgent"] = user_agent
-            
-        try:
-            if verbose:
-                print(f"发送创建任务请求...")
-                
-            response = requests.post(
-                self.create_task_url, 
-                json=data,
-                timeout=self.timeout,
-                impersonate="chrome110"
-            )
-            result = response.json()
-            
-            if verbose:
-                print(f"创建任务响应: {result}")
-                
-            if result.get("errorId") == 0:
-                task_id = result.get("taskId")
-                if verbose:
-                    print(f"成功创建任务，ID: {task_id}")
-                return task_id
-            else:
-                error_desc = result.get('errorDescription', '未知错误')
-                if verbose:
-                    print(f"创建任务失败: {error_desc}")
-                return None
-                
-        except Exception as e:
-            if verbose:
-                print(f"创建任务过程中发生异常: {e}")
-            return None
-    
-    def _get_task_result(self, task_id: str, verbose: bool = False) -> Optional[str]:
-        """获取任务结果"""
-        
-        data = {
-            "clientKey": self.api_key,
-            "taskId": task_id
-        }
-        
-        for attempt in range(1, self.max_retries + 1):
-            try:
-                if verbose:
-                    print(f"尝试获取任务结果 ({attempt}/{self.max_retries})...")
-                    
-                response = requests.post(
-                    self.get_result_url,
-                    json=data,
-                    timeout=self.timeout,
-                    impersonate="chrome110"
-                )
-                result = response.json()
-                
-                if result.get("errorId") > 0:
-                    error_desc = result.get('errorDescription', '未知错误')
-                    if verbose:
-                        print(f"获取结果失败: {error_desc}")
-                    return None
-                
-                status = result.get("status")
-                
-                # 状态为ready表示已完成
-                if status == "ready":
-                    token = result.get("solution", {}).get("token")
-                    if verbose:
-                        print("任务已完成")
-                    return token
-                
-                # 状态为processing表示处理中，需等待重试
-                elif status == "processing":
-                    if verbose:
-                        print(f"任务处理中，等待 {self.retry_interval} 秒后重试...")
-                    time.sleep(self.retry_interval)
-                    continue
-                    
-            except Exception as e:
-                if verbose:
-                    print(f"获取任务结果过程中发生异常: {e}")
-                return None
-                
-        if verbose:
-            print("获取任务结果超时")
-        return None
-
-"""
-# 简单使用示例
-if __name__ == "__main__":
-    # 示例用法
-    api_key = "YOUR_2CAPTCHA_API_KEY"
-    
-    solver = TwoCaptchaSolver(
-        api_key=api_key,
-        verbose=True
-    )
-    try:
-        token = solver.solve(
-            url="https://www.nodeseek.com/signIn.html",
-            sitekey="0x4AAAAAAAaNy7leGjewpVyR"
-        )
-        print("成功获取令牌！")
-        print(f"令牌: {token[:30]}...{token[-10:]}")
-    except TwoCaptchaSolverError as e:
-        print(f"解决 Turnstile 验证码失败: {e}")
-""" 
\ No newline at end of file
+from curl_cffi import requests, CurlHttpVersion
+from curl_cffi.requests import AsyncSession
+import asyncio
+import json
+import logging
+import random
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Dict, Optional, Any, Union, List, Tuple, Iterator
+
+log = logging.getLogger(__name__)
+# 作为库使用时不主动输出日志，由调用方配置 logging 或传入 verbose
+log.addHandler(logging.NullHandler())
+
+# orjson 可选，未安装时回退到标准库 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+def _json_dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+def _json_loads(body: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+# verbose 调用可能并发或嵌套，按引用计数开启，最后一个结束时恢复原日志配置
+_VERBOSE_LOCK = threading.Lock()
+_verbose_depth = 0
+_verbose_saved_level = logging.NOTSET
+_verbose_handler: Optional[logging.Handler] = None
+
+@contextmanager
+def _verbose_logging(enabled: bool) -> Iterator[None]:
+    """兼容旧的 verbose 参数: 调用期间将本模块的调试日志输出到终端"""
+    global _verbose_depth, _verbose_saved_level, _verbose_handler
+    if not enabled:
+        yield
+        return
+    with _VERBOSE_LOCK:
+        if _verbose_depth == 0:
+            _verbose_saved_level = log.level
+            log.setLevel(logging.DEBUG)
+            # 调用方未配置 logging 时才直接输出到终端
+            if not logging.getLogger().handlers:
+                _verbose_handler = logging.StreamHandler(sys.stdout)
+                _verbose_handler.setFormatter(logging.Formatter("%(message)s"))
+                log.addHandler(_verbose_handler)
+        _verbose_depth += 1
+    try:
+        yield
+    finally:
+        with _VERBOSE_LOCK:
+            _verbose_depth -= 1
+            if _verbose_depth == 0:
+                log.setLevel(_verbose_saved_level)
+                if _verbose_handler is not None:
+                    log.removeHandler(_verbose_handler)
+                    _verbose_handler = None
+
+# 表示被限流的错误码，需放慢轮询
+RATE_LIMIT_ERRORS = {"ERROR_NO_SLOT_AVAILABLE", "ERROR_IP_BLOCKED", "IP_BANNED"}
+
+# 密钥、余额或参数错误，重试也不会成功，应立即失败
+FATAL_ERRORS = {
+    "ERROR_WRONG_USER_KEY",
+    "ERROR_KEY_DOES_NOT_EXIST",
+    "ERROR_ZERO_BALANCE",
+    "ERROR_PAGEURL",
+    "ERROR_GOOGLEKEY",
+}
+
+# 网络抖动或超时等传输层故障
+TRANSPORT_EXCEPTIONS = (requests.RequestsError, TimeoutError, ConnectionError)
+
+# 传输层故障或响应体无法解析等短暂故障，可以重试
+RETRYABLE_EXCEPTIONS = TRANSPORT_EXCEPTIONS + (json.JSONDecodeError,)
+if orjson is not None:
+    RETRYABLE_EXCEPTIONS += (orjson.JSONDecodeError,)
+
+# 轮询时绝大多数响应为处理中，直接匹配原始字节即可，无需解析 JSON
+_PROCESSING_MARKER = b'"status":"processing"'
+_PROCESSING_RESULT = {"errorId": 0, "status": "processing"}
+
+# 已获取令牌的缓存: (url, sitekey, user_agent) -> (令牌, 过期时间)
+_TOKEN_CACHE: Dict[Tuple[str, str, Optional[str]], Tuple[str, float]] = {}
+_TOKEN_CACHE_LOCK = threading.Lock()
+
+class TwoCaptchaSolverError(Exception):
+    """2Captcha 解决器错误基类"""
+    pass
+
+class _TwoCaptchaBase:
+    """2Captcha 同步/异步解决器共用的配置"""
+    
+    # 所有实例共享的上游健康状态: 最近一次 createTask 网络异常或 5xx 的时间
+    _HEALTH_COOLDOWN = 10.0
+    _last_failure_ts: Optional[float] = None
+    _health_lock = threading.Lock()
+    
+    def __init__(
+        self, 
+        api_key: str,
+        api_base_url: str = "https://api.2captcha.com",
+        max_retries: int = 20,
+        retry_interval: int = 5,
+        timeout: int = 60,
+        backoff_base: float = 1.0,
+        backoff_cap: float = 8.0,
+        total_deadline: Optional[float] = None,
+        seed: Optional[int] = None,
+        circuit_threshold: int = 5,
+        circuit_window: float = 60.0,
+        circuit_cooldown: float = 30.0,
+        token_ttl: float = 0.0
+    ):
+        """
+        初始化 2Captcha 验证码解决器
+        
+        参数:
+            api_key: 2Captcha API 密钥
+            api_base_url: API 基础 URL，默认为 2Captcha 官方节点
+            max_retries: 最大重试次数，未指定 total_deadline 时与 retry_interval 相乘作为轮询总时限
+            retry_interval: 重试间隔(秒)，轮询已改用指数退避，仅用于推算默认的轮询总时限
+            timeout: 请求超时时间(秒)
+            backoff_base: 指数退避初始间隔(秒)
+            backoff_cap: 指数退避最大间隔(秒)
+            total_deadline: 轮询任务结果的总时限(秒)，包含请求耗时与等待时间，
+                默认为 max_retries * retry_interval
+            seed: 退避抖动随机数种子，便于复现
+            circuit_threshold: 熔断阈值，窗口内失败达到该次数后暂停请求
+            circuit_window: 统计失败次数的时间窗口(秒)
+            circuit_cooldown: 熔断后的冷却时间(秒)
+            token_ttl: 令牌缓存有效期(秒)，默认 0 不缓存。Turnstile 令牌通常只能使用一次，
+                仅在令牌不会被目标站点消耗时开启，且应小于令牌约 300 秒的有效期
+        """
+        self.api_key = api_key
+        self.api_base_url = api_base_url
+        self.create_task_url = f"{api_base_url}/createTask"
+        self.get_result_url = f"{api_base_url}/getTaskResult"
+        # 创建任务与获取结果的请求体共用的部分
+        self._client_base = {"clientKey": api_key}
+        self.max_retries = max_retries
+        self.retry_interval = retry_interval
+        self.timeout = timeout
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        if total_deadline is None:
+            total_deadline = max_retries * retry_interval
+        self.total_deadline = total_deadline
+        self._random = random.Random(seed)
+        self.circuit_threshold = circuit_threshold
+        self.circuit_window = circuit_window
+        self.circuit_cooldown = circuit_cooldown
+        self._failures: deque = deque()
+        self._circuit_open_until = 0.0
+        self.token_ttl = token_ttl
+        # 会话在首次请求时创建
+        self.session = None
+    
+    def invalidate(self, url: str, sitekey: str) -> None:
+        """移除指定站点的缓存令牌，令牌已被使用或被目标站点拒绝时调用"""
+        with _TOKEN_CACHE_LOCK:
+            for key in [k for k in _TOKEN_CACHE if k[:2] == (url, sitekey)]:
+                del _TOKEN_CACHE[key]
+    
+    def _get_cached_token(self, key: Tuple[str, str, Optional[str]]) -> Optional[str]:
+        if self.token_ttl <= 0:
+            return None
+        with _TOKEN_CACHE_LOCK:
+            entry = _TOKEN_CACHE.get(key)
+            if entry is None:
+                return None
+            token, expires_at = entry
+            if expires_at <= time.monotonic():
+                del _TOKEN_CACHE[key]
+                return None
+            return token
+    
+    def _cache_token(self, key: Tuple[str, str, Optional[str]], token: str) -> None:
+        if self.token_ttl <= 0:
+            return
+        with _TOKEN_CACHE_LOCK:
+            _TOKEN_CACHE[key] = (token, time.monotonic() + self.token_ttl)
+    
+    def _check_circuit(self) -> None:
+        """熔断期间直接拒绝请求，避免重复提交注定失败的任务"""
+        remaining = self._circuit_open_until - time.monotonic()
+        if remaining > 0:
+            raise TwoCaptchaSolverError(f"验证码服务连续失败，熔断中，请 {remaining:.0f} 秒后重试")
+    
+    def _check_upstream_health(self) -> None:
+        """其他实例刚遇到上游故障时快速失败，不再重复等待同样的超时"""
+        with _TwoCaptchaBase._health_lock:
+            last_failure = _TwoCaptchaBase._last_failure_ts
+        if last_failure is None:
+            return
+        remaining = self._HEALTH_COOLDOWN - (time.monotonic() - last_failure)
+        if remaining > 0:
+            raise TwoCaptchaSolverError(f"2Captcha 服务近期请求失败，请 {remaining:.0f} 秒后重试")
+    
+    @staticmethod
+    def _mark_upstream_failure() -> None:
+        """记录上游故障(网络异常或 5xx)，任务级失败只计入各实例的熔断计数"""
+        with _TwoCaptchaBase._health_lock:
+            _TwoCaptchaBase._last_failure_ts = time.monotonic()
+    
+    def _record_failure(self) -> None:
+        now = time.monotonic()
+        self._failures.append(now)
+        while self._failures and now - self._failures[0] > self.circuit_window:
+            self._failures.popleft()
+        if len(self._failures) >= self.circuit_threshold:
+            self._circuit_open_until = now + self.circuit_cooldown
+    
+    def _record_success(self) -> None:
+        self._failures.clear()
+        self._circuit_open_until = 0.0
+        with _TwoCaptchaBase._health_lock:
+            _TwoCaptchaBase._last_failure_ts = None
+    
+    def _backoff_delay(self, attempt: int) -> float:
+        """计算第 attempt 次轮询后的等待时间(指数退避 + 全抖动)"""
+        ceiling = min(self.backoff_cap, self.backoff_base * (2 ** (attempt - 1)))
+        return self._random.uniform(0, ceiling)
+    
+    @staticmethod
+    def _clamp_delay(delay: float, deadline: float) -> float:
+        """将等待时间限制在剩余时限内"""
+        return max(0.0, min(delay, deadline - time.monotonic()))
+    
+    @staticmethod
+    def _parse_retry_after(response) -> float:
+        """解析 Retry-After 响应头，返回需等待的秒数，无法解析时返回 0"""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return 0.0
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+            # 时区写作 -0000 时解析结果不带时区，按 UTC 处理
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return 0.0
+    
+    @staticmethod
+    def _raise_if_fatal(result: Dict[str, Any]) -> None:
+        """遇到不可重试的错误码时直接抛出异常"""
+        error_code = result.get("errorCode")
+        if error_code in FATAL_ERRORS:
+            error_desc = result.get('errorDescription', '未知错误')
+            raise TwoCaptchaSolverError(f"{error_code}: {error_desc}")
+    
+    def _rate_limit_delay(self, response, result: Dict[str, Any], attempt: int) -> Optional[float]:
+        """若响应表示被限流，返回应等待的秒数，否则返回 None"""
+        if response.status_code != 429 and result.get("errorCode") not in RATE_LIMIT_ERRORS:
+            return None
+        return self._parse_retry_after(response) or self._backoff_delay(attempt)
+    
+    def _build_create_request(
+        self,
+        url: str,
+        sitekey: str,
+        user_agent: Optional[str] = None
+    ) -> Tuple[str, Dict[str, Any]]:
+        """构造创建任务请求，返回 (请求地址, 请求参数)"""
+        
+        # 准备任务数据 - 使用JSON格式，与YesCaptcha类似
+        data = {
+            **self._client_base,
+            "task": {
+                "type": "TurnstileTaskProxyless",
+                "websiteURL": url,
+                "websiteKey": sitekey
+            }
+        }
+        
+        # 如果需要添加用户代理
+        if user_agent:
+            data["task"]["userAgent"] = user_agent
+            
+        return self.create_task_url, {
+            "data": _json_dumps(data),
+            "headers": _JSON_HEADERS,
+            "timeout": self.timeout
+        }
+    
+    def _parse_create_response(self, response) -> Optional[str]:
+        """解析创建任务响应，成功时返回任务ID"""
+        if response.status_code >= 500:
+            self._mark_upstream_failure()
+            log.warning("创建任务失败: HTTP %s", response.status_code)
+            return None
+        
+        result = _json_loads(response.content)
+        
+        log.debug("创建任务响应: %s", result)
+        
+        if not isinstance(result, dict):
+            log.warning("创建任务失败: 响应格式异常")
+            return None
+            
+        if result.get("errorId") == 0:
+            task_id = result.get("taskId")
+            log.debug("成功创建任务，ID: %s", task_id)
+            return task_id
+        
+        self._raise_if_fatal(result)
+        error_desc = result.get('errorDescription', '未知错误')
+        log.warning("创建任务失败: %s", error_desc)
+        return None
+    
+    def _build_poll_request(self, task_id: str) -> Tuple[str, Dict[str, Any]]:
+        """构造获取任务结果请求，返回 (请求地址, 请求参数)"""
+        # 轮询期间请求体不变，只序列化一次
+        return self.get_result_url, {
+            "data": _json_dumps({**self._client_base, "taskId": task_id}),
+            "headers": _JSON_HEADERS,
+            "timeout": self.timeout
+        }
+    
+    def _parse_poll_response(self, response, attempt: int) -> Tuple[str, Any]:
+        """
+        解析获取任务结果响应
+        
+        返回:
+            (状态, 值): ("ready", 令牌)、("failed", None)，
+            或 ("pending"/"rate_limited", 建议等待的秒数)
+        """
+        content = response.content
+        if response.status_code == 429:
+            result = {}
+        elif _PROCESSING_MARKER in content:
+            result = _PROCESSING_RESULT
+        else:
+            result = _json_loads(content)
+            if not isinstance(result, dict):
+                # 响应格式异常按可重试的解析错误处理，继续等待
+                log.warning("获取结果响应格式异常: %s", result)
+                result = {}
+        
+        # 被限流时优先遵循服务端给出的 Retry-After
+        delay = self._rate_limit_delay(response, result, attempt)
+        if delay is not None:
+            return "rate_limited", delay
+        
+        if result.get("errorId"):
+            self._raise_if_fatal(result)
+            error_desc = result.get('errorDescription', '未知错误')
+            log.warning("获取结果失败: %s", error_desc)
+            return "failed", None
+        
+        # 状态为ready表示已完成
+        if result.get("status") == "ready":
+            log.debug("任务已完成")
+            return "ready", (result.get("solution") or {}).get("token")
+        
+        # 状态为processing表示处理中，需等待重试；其他未知状态同样等待，避免空转
+        return "pending", self._backoff_delay(attempt)
+    
+    def _next_poll_delay(self, outcome: str, delay: float, deadline: float) -> float:
+        """将等待时间限制在剩余时限内并记录日志"""
+        delay = self._clamp_delay(delay, deadline)
+        if outcome == "rate_limited":
+            log.warning("2Captcha 请求被限流，等待 %.1f 秒后重试...", delay)
+        else:
+            log.debug("任务处理中，等待 %.1f 秒后重试...", delay)
+        return delay
+
+
+class TwoCaptchaSolver(_TwoCaptchaBase):
+    """
+    2Captcha 验证码解决工具
+    
+    使用 2Captcha API 解决 Turnstile 验证码，获取验证令牌
+    参考文档: https://2captcha.com/2captcha-api
+    
+    实例内复用同一个会话，轮询时无需重复建立 TCP/TLS 连接。
+    建议以上下文管理器方式使用，退出时自动关闭会话:
+    
+        with TwoCaptchaSolver(api_key=api_key) as solver:
+            token = solver.solve(url=url, sitekey=sitekey)
+    """
+    
+    def __enter__(self) -> "TwoCaptchaSolver":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """关闭底层会话"""
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+    
+    def _get_session(self) -> requests.Session:
+        if self.session is None:
+            # 显式启用 HTTP/2，同一连接上可复用多个请求流
+            self.session = requests.Session(impersonate="chrome110", http_version=CurlHttpVersion.V2_0)
+        return self.session
+    
+    def solve(
+        self,
+        url: str,
+        sitekey: str,
+        user_agent: Optional[str] = None,
+        verbose: bool = False
+    ) -> str:
+        """
+        解决 Turnstile 验证并返回令牌
+        
+        参数:
+            url: 目标网站 URL
+            sitekey: Turnstile sitekey
+            user_agent: 自定义 User-Agent
+            verbose: 是否将本模块的详细日志输出到终端，也可直接配置 logging
+            
+        返回:
+            验证令牌字符串
+            
+        异常:
+            TwoCaptchaSolverError: 解决验证码时出错
+        """
+        with _verbose_logging(verbose):
+            cache_key = (url, sitekey, user_agent)
+            token = self._get_cached_token(cache_key)
+            if token:
+                log.debug("使用缓存的验证令牌")
+                return token
+            
+            return self._solve(url, sitekey, user_agent, cache_key)
+    
+    def _solve(
+        self,
+        url: str,
+        sitekey: str,
+        user_agent: Optional[str],
+        cache_key: Tuple[str, str, Optional[str]]
+    ) -> str:
+        """实际创建任务并轮询结果"""
+        self._check_circuit()
+        self._check_upstream_health()
+        
+        log.debug("正在创建 2Captcha 验证任务...")
+            
+        task_id = self._create_task(url, sitekey, user_agent)
+        if not task_id:
+            self._record_failure()
+            raise TwoCaptchaSolverError("创建验证码任务失败")
+            
+        # 获取任务结果
+        token = self._get_task_result(task_id)
+        if not token:
+            self._record_failure()
+            raise TwoCaptchaSolverError("获取验证码结果失败")
+        
+        self._record_success()
+        self._cache_token(cache_key, token)
+            
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("验证码解决成功: %s...%s", token[:30], token[-10:] if len(token) > 30 else "")
+            
+        return token
+        
+    def _create_task(
+        self,
+        url: str,
+        sitekey: str,
+        user_agent: Optional[str] = None
+    ) -> Optional[str]:
+        """创建验证码任务并返回任务ID"""
+        
+        request_url, kwargs = self._build_create_request(url, sitekey, user_agent)
+        try:
+            log.debug("发送创建任务请求...")
+            response = self._get_session().post(request_url, **kwargs)
+            return self._parse_create_response(response)
+        except RETRYABLE_EXCEPTIONS as e:
+            # 仅网络层故障计入上游健康状态，响应体无法解析不代表服务不可用
+            if isinstance(e, TRANSPORT_EXCEPTIONS):
+                self._mark_upstream_failure()
+            log.warning("创建任务过程中发生异常: %s", e)
+            return None
+    
+    def _get_task_result(self, task_id: str) -> Optional[str]:
+        """获取任务结果"""
+        
+        request_url, kwargs = self._build_poll_request(task_id)
+        deadline = time.monotonic() + self.total_deadline
+        attempt = 0
+        
+        while time.monotonic() < deadline:
+            attempt += 1
+            log.debug("尝试获取任务结果 (第 %d 次)...", attempt)
+            try:
+                response = self._get_session().post(request_url, **kwargs)
+                outcome, value = self._parse_poll_response(response, attempt)
+            except RETRYABLE_EXCEPTIONS as e:
+                log.warning("获取任务结果过程中发生异常: %s", e)
+                outcome, value = "pending", self._backoff_delay(attempt)
+            
+            if outcome == "ready":
+                return value
+            if outcome == "failed":
+                return None
+            time.sleep(self._next_poll_delay(outcome, value, deadline))
+                
+        log.warning("获取任务结果超时")
+        return None
+
+
+class AsyncTwoCaptchaSolver(_TwoCaptchaBase):
+    """
+    2Captcha 验证码解决工具(异步版)
+    
+    与 TwoCaptchaSolver 参数一致，轮询等待期间不阻塞线程，
+    可在同一进程内并发解决多个验证码。实例内的所有请求共用一个会话，
+    建议以异步上下文管理器方式使用:
+    
+        async with AsyncTwoCaptchaSolver(api_key=api_key) as solver:
+            token = await solver.solve(url=url, sitekey=sitekey)
+    """
+    
+    async def __aenter__(self) -> "AsyncTwoCaptchaSolver":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+    
+    async def close(self) -> None:
+        """关闭底层会话"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+    
+    def _get_session(self) -> AsyncSession:
+        if self.session is None:
+            # 会话需绑定到事件循环，首次请求时再创建；并发的 solve 通过 HTTP/2 多路复用共享同一条连接
+            self.session = AsyncSession(impersonate="chrome110", http_version=CurlHttpVersion.V2_0)
+        return self.session
+    
+    async def solve(
+        self,
+        url: str,
+        sitekey: str,
+        user_agent: Optional[str] = None,
+        verbose: bool = False
+    ) -> str:
+        """
+        解决 Turnstile 验证并返回令牌
+        
+        参数:
+            url: 目标网站 URL
+            sitekey: Turnstile sitekey
+            user_agent: 自定义 User-Agent
+            verbose: 是否将本模块的详细日志输出到终端，也可直接配置 logging
+            
+        返回:
+            验证令牌字符串
+            
+        异常:
+            TwoCaptchaSolverError: 解决验证码时出错
+        """
+        with _verbose_logging(verbose):
+            cache_key = (url, sitekey, user_agent)
+            token = self._get_cached_token(cache_key)
+            if token:
+                log.debug("使用缓存的验证令牌")
+                return token
+            
+            return await self._solve(url, sitekey, user_agent, cache_key)
+    
+    async def _solve(
+        self,
+        url: str,
+        sitekey: str,
+        user_agent: Optional[str],
+        cache_key: Tuple[str, str, Optional[str]]
+    ) -> str:
+        """实际创建任务并轮询结果"""
+        self._check_circuit()
+        self._check_upstream_health()
+        
+        log.debug("正在创建 2Captcha 验证任务...")
+            
+        task_id = await self._create_task(url, sitekey, user_agent)
+        if not task_id:
+            self._record_failure()
+            raise TwoCaptchaSolverError("创建验证码任务失败")
+            
+        # 获取任务结果
+        token = await self._get_task_result(task_id)
+        if not token:
+            self._record_failure()
+            raise TwoCaptchaSolverError("获取验证码结果失败")
+        
+        self._record_success()
+        self._cache_token(cache_key, token)
+            
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("验证码解决成功: %s...%s", token[:30], token[-10:] if len(token) > 30 else "")
+            
+        return token
+    
+    async def solve_many(
+        self,
+        tasks: List[Dict[str, Any]],
+        concurrency: int = 5,
+        verbose: bool = False
+    ) -> List[Union[str, BaseException]]:
+        """
+        并发解决多个 Turnstile 验证
+        
+        参数:
+            tasks: 任务列表，每项为 solve 的关键字参数，如 {"url": ..., "sitekey": ...}
+            concurrency: 最大并发数
+            verbose: 是否将本模块的详细日志输出到终端，也可直接配置 logging
+            
+        返回:
+            与 tasks 顺序一致的结果列表，成功为令牌字符串，失败为异常对象
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def _bounded_solve(task: Dict[str, Any]) -> str:
+            async with semaphore:
+                return await self.solve(verbose=verbose, **task)
+        
+        return await asyncio.gather(
+            *[_bounded_solve(task) for task in tasks],
+            return_exceptions=True
+        )
+        
+    async def _create_task(
+        self,
+        url: str,
+        sitekey: str,
+        user_agent: Optional[str] = None
+    ) -> Optional[str]:
+        """创建验证码任务并返回任务ID"""
+        
+        request_url, kwargs = self._build_create_request(url, sitekey, user_agent)
+        try:
+            log.debug("发送创建任务请求...")
+            response = await self._get_session().post(request_url, **kwargs)
+            return self._parse_create_response(response)
+        except RETRYABLE_EXCEPTIONS as e:
+            # 仅网络层故障计入上游健康状态，响应体无法解析不代表服务不可用
+            if isinstance(e, TRANSPORT_EXCEPTIONS):
+                self._mark_upstream_failure()
+            log.warning("创建任务过程中发生异常: %s", e)
+            return None
+    
+    async def _get_task_result(self, task_id: str) -> Optional[str]:
+        """获取任务结果"""
+        
+        request_url, kwargs = self._build_poll_request(task_id)
+        deadline = time.monotonic() + self.total_deadline
+        attempt = 0
+        
+        while time.monotonic() < deadline:
+            attempt += 1
+            log.debug("尝试获取任务结果 (第 %d 次)...", attempt)
+            try:
+                response = await self._get_session().post(request_url, **kwargs)
+                outcome, value = self._parse_poll_response(response, attempt)
+            except RETRYABLE_EXCEPTIONS as e:
+                log.warning("获取任务结果过程中发生异常: %s", e)
+                outcome, value = "pending", self._backoff_delay(attempt)
+            
+            if outcome == "ready":
+                return value
+            if outcome == "failed":
+                return None
+            await asyncio.sleep(self._next_poll_delay(outcome, value, deadline))
+                
+        log.warning("获取任务结果超时")
+        return None
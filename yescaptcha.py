@@ -43,6 +43,18 @@ class YesCaptchaSolver:
         self.retry_interval = retry_interval
         self.timeout = timeout
         self.advanced = advanced
+        # 复用会话，指纹配置与连接在多次请求间共享
+        self.session = requests.Session(impersonate="chrome110")
+    
+    def __enter__(self) -> "YesCaptchaSolver":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """关闭底层会话"""
+        self.session.close()
     
     def solve(
         self,
@@ -113,11 +125,10 @@ class YesCaptchaSolver:
             #if verbose:
             #    print(f"发送创建任务请求: {data}")
                 
-            response = requests.post(
+            response = self.session.post(
                 self.create_task_url, 
                 json=data,
-                timeout=self.timeout,
-                impersonate="chrome110"
+                timeout=self.timeout
             )
             result = response.json()
             
@@ -153,11 +164,10 @@ class YesCaptchaSolver:
                 if verbose:
                     print(f"尝试获取任务结果 ({attempt}/{self.max_retries})...")
                     
-                response = requests.post(
+                response = self.session.post(
                     self.get_result_url,
                     json=data,
-                    timeout=self.timeout,
-                    impersonate="chrome110"
+                    timeout=self.timeout
                 )
                 result = response.json()
                 